@@ -9,24 +9,28 @@ Helpful utilities from mother.
 """
 
 from collections import namedtuple
+from collections.abc import Mapping, MutableMapping
 from enum import Enum
 from itertools import tee
-from insensitive_dict import CaseInsensitiveDict
 from typing import Iterator
 
+_MISSING = object()  #: a sentinel that stands in for a value that isn't there
+
 
 class TryGetResult(namedtuple('TryResult', ['result', 'value'])):
     """
     This is a named tuple that contains a ``bool`` result that indicates success or failure of a "try-get" operation,
     and the value retrieved.
     """
+    __slots__ = ()  #: Don't give each result a ``__dict__`` (the tuple already holds everything).
 
 
 class Enums(object):
     """
     This is a utility class that wants to help you work with :py:class:`Enum` types.
     """
-    _names2members = {}  #: An index of enumeration member values indexed first by class, then by member name.
+    _names2members = {}  #: An index of enumeration member values indexed first by class, then by lower-case name.
+    _resolved = {}  #: The members we've already looked up, indexed by (class, name) exactly as they were requested.
 
     @staticmethod
     def from_name(enum_cls, name: str) -> Enum:
@@ -40,6 +44,10 @@ class Enums(object):
         :return: the enumeration member
         :rtype:  :py:class:`Enum`
         """
+        # If somebody has asked for this exact name before, we already know the answer.
+        member = Enums._resolved.get((enum_cls, name))
+        if member is not None:
+            return member
         # Benign forgiveness:  If we were actually passed a value from the enumeration instead of its name...
         if isinstance(name, enum_cls):
             # ...that's OK.  Just return the enumeration value.
@@ -48,22 +56,87 @@ class Enums(object):
         if not issubclass(enum_cls, Enum):
             raise ValueError('enum_class must be of type {typ}'.format(typ=type(Enum)))
         # Now let's get a reference to the index of symbols to their enumeration members.
-        symbols2members = None
-        # It's possible we haven't see this type before, so we may not have the index on file.
-        try:
-            symbols2members = Enums._names2members[enum_cls]
-        except KeyError:  # This is all right.  It should only happen the first time.
-            pass
-        # If we haven't already done so...
+        symbols2members = Enums._names2members.get(enum_cls)
+        # It's possible we haven't see this type before, so we may not have the index on file.  If that's the case...
         if symbols2members is None:
-            # ...now's the time to create the index of symbols to the member names.
-            symbols2members = CaseInsensitiveDict({
-                _name: _member for _name, _member in enum_cls.__members__.items()
+            # ...now's the time to create the index of symbols to the member names.  (The keys are lower-case so
+            # lookups can be case-insensitive without the overhead of a case-insensitive dictionary.)  If another
+            # thread beats us to it, setdefault() makes sure everybody ends up using the same index.
+            symbols2members = Enums._names2members.setdefault(enum_cls, {
+                _name.lower(): _member for _name, _member in enum_cls.__members__.items()
             })
-            # Now save the collection we just created for next time.
-            Enums._names2members[enum_cls] = symbols2members
-        # Return the enumeration member indexed to the symbol that was passed in.
-        return symbols2members[name]
+        # Get the enumeration member indexed to the symbol that was passed in...
+        member = symbols2members[name.lower()]
+        # ...and remember it for next time.
+        Enums._resolved[(enum_cls, name)] = member
+        return member
+
+
+class CaseInsensitiveDict(MutableMapping):
+    """
+    This is a dictionary whose (``str``) keys are case-insensitive.  It remembers the case of the last key that was set,
+    so iterating over the keys gives you back the keys the way they were written.
+
+    :param data: a mapping (or an iterable of key-value pairs) to copy into the new dictionary
+    :type data:  ``dict``
+    """
+    __slots__ = ('_store',)
+
+    def __init__(self, data=None, **kwargs):
+        self._store = {}  #: the original keys and values, indexed by lower-case key
+        self.update(data if data is not None else (), **kwargs)
+
+    # (The keys are folded with str.lower() rather than key.lower() so that a key that isn't a string raises a
+    # TypeError we can turn into the KeyError callers expect, instead of some other object's idea of lower().)
+
+    def __getitem__(self, key: str):
+        try:
+            return self._store[str.lower(key)][1]
+        except TypeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        try:
+            self._store[str.lower(key)] = (key, value)
+        except TypeError:
+            raise KeyError(key) from None
+
+    def __delitem__(self, key: str):
+        try:
+            del self._store[str.lower(key)]
+        except TypeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and key.lower() in self._store
+
+    def __iter__(self):
+        return (key for key, _ in self._store.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __repr__(self):
+        return '{cls}({items})'.format(cls=type(self).__name__, items=dict(self._store.values()))
+
+    def get(self, key: str, default=None):
+        if not isinstance(key, str):
+            return default
+        item = self._store.get(key.lower())
+        return item[1] if item is not None else default
+
+    def update(self, data=(), **kwargs):
+        # Build the lower-case index for everything in one go (rather than setting the items one at a time).
+        items = data.items() if isinstance(data, Mapping) else data
+        try:
+            self._store.update({str.lower(key): (key, value) for key, value in items})
+        except TypeError as te:
+            raise KeyError('CaseInsensitiveDict keys must be strings.') from te
+        if kwargs:
+            self._store.update({key.lower(): (key, value) for key, value in kwargs.items()})
+
+    def copy(self):
+        return CaseInsensitiveDict(dict(self._store.values()))
 
 
 class Dicts(object):
@@ -82,15 +155,15 @@ class Dicts(object):
         :param default: the value that will be returned if no value is defined for the key
         :return: a named tuple that indicates whether or not the key was defined, and the value
         :rtype:  :py:class:`TryGetResult`
+
+        .. note::
+
+            If you only need the value (and not whether or not the key was defined), ``dict.get`` is cheaper.
         """
-        if obj is None:  # Sanity check.
-            return TryGetResult(False, default)
-        elif key in obj:  # If the key is defined...
-            # ...just return the value.
-            return TryGetResult(True, obj[key])
-        else:  # We didn't find the key, eh?...
-            # ...return the default value to the caller.
-            return TryGetResult(False, default)
+        # Look the key up just once (using a sentinel to tell us if it isn't there).
+        value = obj.get(key, _MISSING) if obj is not None else _MISSING
+        # If we didn't find the key, return the default value to the caller.  Otherwise, just return the value.
+        return TryGetResult(False, default) if value is _MISSING else TryGetResult(True, value)
 
 
 class Iters(object):
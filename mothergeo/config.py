@@ -9,28 +9,130 @@ May I take your order, please?
 """
 
 import os
+import re
+import sys
 from configparser import ConfigParser
+from functools import lru_cache
+from typing import Dict
+
+_SECTION_RE = re.compile(r'\[([^\]\n]+)\]')  #: matches a (whole, stripped) section header line
+_OPTION_RE = re.compile(r'([^=:;#\[\s][^=:\n]*?)\s*[:=]\s*(.*)')  #: matches a (whole, stripped) option line
+
+
+@lru_cache(maxsize=1024)
+def _lower_key(section: str, option: str) -> (str or None, str or None):
+    """
+    Create (and remember) a lower-case dictionary key from a configuration section name and option.
+
+    :param section: the configuration section
+    :type section:  ``str``
+    :param option: the configuration option name
+    :type option:  ``str``
+    :return: a key based upon the argument values, suitable for use in a dictionary
+    :rtype:  ``tuple(str or None, str or None)``
+    """
+    # The keys are interned so that dictionary lookups can usually get by with an identity comparison.
+    return (sys.intern(str.lower(section)) if section is not None else None,
+            sys.intern(str.lower(option)) if option is not None else None)
+
+
+def _parse_simple_ini(text: str) -> Dict[str, Dict[str, str]] or None:
+    """
+    Parse the text of a simple INI file (sections of ``key = value`` lines) a line at a time.
+
+    :param text: the contents of the configuration file
+    :type text:  ``str``
+    :return: the options indexed by section, or ``None`` if the text needs the full :py:class:`ConfigParser` treatment
+    :rtype:  ``dict`` or ``None``
+    """
+    # Values that need interpolating (or might fail to) are left to ConfigParser.
+    if '%' in text:
+        return None
+    sections = {}
+    section = None
+    # (ConfigParser.read_string() only breaks lines on '\n', so we won't either.)
+    for line in text.split('\n'):
+        stripped = line.strip()
+        # Blank lines and comments don't tell us anything.
+        if not stripped or stripped[0] in '#;':
+            continue
+        # An indented line continues the value above it, and we'll leave multi-line values to ConfigParser.
+        if line[0].isspace():
+            return None
+        match = _SECTION_RE.fullmatch(stripped)
+        if match is not None:
+            name = match.group(1)
+            # ConfigParser doesn't allow a section to appear twice in the same file.
+            if name in sections:
+                return None
+            section = sections[name] = {}
+            continue
+        match = _OPTION_RE.fullmatch(stripped)
+        # If we can't make sense of a line (or it comes before the first section), ConfigParser will want to complain
+        # about it.
+        if match is None or section is None:
+            return None
+        option = match.group(1).lower()
+        # ConfigParser doesn't allow an option to appear twice in the same section, either.
+        if option in section:
+            return None
+        section[option] = match.group(2)
+    return sections
 
 
 class ConfigurationManager(object):
     """
     Use a configuration manager to keep track of the configurable aspects of the system.
     """
+    __slots__ = ('_config_parser', '_env_overrides', '_load_cache')
+
     def __init__(self):
         # Create the built-in Python configuration parser we'll use to read configuration in from a file.
         self._config_parser = ConfigParser()
         # It's possible for data_store variables to override values configured elsewhere.  This is how we'll keep
         # track of what overrides what.
         self._env_overrides = {}
+        # We remember what we parsed out of each file (along with the file's modification time and size) so that
+        # loading an unchanged file again doesn't mean parsing it again.
+        self._load_cache = {}
 
-    def load(self, config_info: str):
+    def load(self, config_info: str, encoding: str=None):
         """
         Load configuration information.
         
         :param config_info: the configuration information (most likely a path to a file or something similar)
         :type config_info:  ``str``
+        :param encoding: the encoding of the file (The default is the locale's encoding, just as it is for
+            :py:meth:`ConfigParser.read`.)
+        :type encoding:  ``str``
         """
-        self._config_parser.read(config_info)
+        # Just like ConfigParser.read(), we'll accept a single path or a list of them.
+        paths = [config_info] if isinstance(config_info, (str, bytes, os.PathLike)) else config_info
+        for path in paths:
+            path = os.fspath(path)
+            try:
+                stat = os.stat(path)
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                # If the file hasn't changed since the last time we read it...
+                cached = self._load_cache.get(path)
+                if cached is not None and cached[0] == stamp:
+                    # ...we can use what we parsed last time.
+                    _, text, sections = cached
+                else:
+                    with open(path, encoding=encoding) as config_file:
+                        text = config_file.read()
+                    # Most configuration files are simple enough for the fast parser.
+                    sections = _parse_simple_ini(text)
+                    # We only need to hang on to the raw text if the fast parser couldn't handle it.
+                    self._load_cache[path] = (stamp, text if sections is None else None, sections)
+            except OSError:
+                continue  # ConfigParser.read() quietly skips files it can't open, so we will too.
+            # If the fast parser couldn't handle the file...
+            if sections is None:
+                # ...let the built-in parser deal with it (and raise the errors it would normally raise).
+                self._config_parser.read_string(text, source=str(path))
+            else:
+                self._config_parser.read_dict(sections, source=str(path))
 
     def get(self, section: str, option: str, fallback: str=None) -> str or None:
         """
@@ -45,15 +147,16 @@ class ConfigurationManager(object):
         :return: the configured value
         :rtype:  ``str``
         """
-        # Check to see if there are data_store variables that are supposed to override this option.
-        env_override_key = ConfigurationManager._to_dict_key(section=section, option=option)
-        # If we do have an override, and the mapped data_store variable seems to be configured in the data_store...
-        if env_override_key in self._env_overrides and self._env_overrides[env_override_key] is os.environ:
-            # ...return the data_store variable's value.
-            return os.environ[self._env_overrides[env_override_key]]
-        else:
-            # Otherwise, see what the built-in Python configuration parser has.
-            return self._config_parser.get(section=section, option=option, fallback=fallback)
+        # Check to see if there is an environment variable that is supposed to override this option.
+        env_var = self._env_overrides.get(ConfigurationManager._to_dict_key(section=section, option=option))
+        # If we do have an override...
+        if env_var is not None:
+            value = os.environ.get(env_var)
+            # ...and the mapped environment variable is actually set, its value wins.
+            if value is not None:
+                return value
+        # Otherwise, see what the built-in Python configuration parser has.
+        return self._config_parser.get(section=section, option=option, fallback=fallback)
 
     def map_env_variable(self, section: str, option: str, env_var: str):
         """
@@ -121,8 +224,6 @@ class ConfigurationManager(object):
         :return: a key based upon the argument values, suitable for use in a dictionary
         :rtype:  ``tuple(str or None, str or None)``
         """
-        # Create a tuple key based on the section and option.
-        key = (str.lower(section) if section is not None else None,
-               str.lower(option) if option is not None else None)
-        return key
+        # The same few sections and options are requested over and over, so we let the cache build the tuple.
+        return _lower_key(section, option)
 
@@ -8,27 +8,36 @@
 General tools for working with data models in the database.
 """
 
-from ..schemas.modeling import RelationInfo, FeatureTableInfo
-from abc import ABCMeta, abstractmethod
+from ..schemas.modeling import ModelInfo, RelationInfo, FeatureTableInfo
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Callable, Iterable
 
 
-class Entity(object):
+class DataTypeDefaults(object):
+    """
+    This is a set of constants that represent default options for different data types (for translators and data
+    stores that have to pick something when a field's preferences don't say).
+    """
+    text_length = 150  #: the default length of a text column
+
+
+class Entity(ABC):
     """
     Extend this class to model a data entity (like a row in a table).
     """
-    __metaclass__ = ABCMeta
+    __slots__ = ()  #: Entities may be numerous, so subclasses can decide whether or not they need a ``__dict__``.
 
     @abstractmethod
     def __init__(self, **kwargs):
         pass
 
 
-class EntityClassFactory(object):
+class EntityClassFactory(ABC):
     """
     Extend this class to create utility classes that can create new entity classes based on the information in a 
     :py:class:`RelationInfo` instance.
     """
-    __metaclass__ = ABCMeta
 
     def __init__(self):
         self._classes = {}  #: Holds the manufactured classes.
@@ -39,14 +48,19 @@ class EntityClassFactory(object):
     def get(self, what: RelationInfo or str):
         # The key we'll use to pull the manufactured class from the dictionary is the name applied to the relation
         # information, if that's what the caller gave us.  Otherwise, we assume they're passing in the class name.
-        key = what.name if type(what) is RelationInfo else what
-        # If we don't have a manufactured class on file with the requested name, but the caller has given us enough
-        # information to try to make one...
-        if key not in self._classes and type(what) is RelationInfo:
-            # ...let's do that now.
-            self.make(relation_info=what)
-        # Let's return whatever is indexed to the key.
-        return self._classes[key]
+        key = what if isinstance(what, str) else what.name
+        # Most of the time we'll already have the class on file.
+        cls = self._classes.get(key)
+        if cls is not None:
+            return cls
+        # If the caller only gave us a name, there's nothing more we can do.
+        if isinstance(what, str):
+            raise KeyError(key)
+        # Otherwise, the caller has given us enough information to make the class, so let's do that now (and keep it
+        # for next time).
+        cls = self.make(relation_info=what)
+        self._classes[key] = cls
+        return cls
 
     @abstractmethod
     def make(self, relation_info: RelationInfo) -> type:
@@ -57,7 +71,7 @@ class Feature(Entity):
     """
     Extend this class to model a feature.
     """
-    __metaclass__ = ABCMeta
+    __slots__ = ()
 
     @abstractmethod
     def __init__(self, **kwargs):
@@ -77,17 +91,17 @@ class FeatureTableClassFactory(EntityClassFactory):
     Extend this class to create utility classes that can create new entity classes based on the information in a 
     :py:class:`FeatureTableInfo` instance.
     """
-    __metaclass__ = ABCMeta
 
     @abstractmethod
     def make(self, relation_info: FeatureTableInfo) -> type:
         pass
 
 
-class DataStore(object):
+class DataStore(ABC):
     """
     Extend this class to represent a data store (i.e. a database).
     """
+    __slots__ = ()  #: Subclasses can decide whether or not they need a ``__dict__``.
 
     @abstractmethod
     def add(self, entity: Entity):
@@ -99,6 +113,19 @@ class DataStore(object):
         """
         pass
 
+    def add_many(self, entities: Iterable[Entity], batch_size: int=1000):
+        """
+        Add a number of entities to the data store.  Override this method if your data store has a faster way to add
+        entities in bulk.
+
+        :param entities: the entities you want to add
+        :type entities:  ``iter(``:py:class:`Entity```)``
+        :param batch_size: the number of entities the data store should handle at a time
+        :type batch_size:  ``int``
+        """
+        for entity in entities:
+            self.add(entity)
+
     @abstractmethod
     def commit(self):
         """
@@ -106,3 +133,49 @@ class DataStore(object):
         """
         pass
 
+
+class ModelTranslator(ABC):
+    """
+    Extend this class to translate a :py:class:`ModelInfo` into a format your database can understand natively (like a
+    DDL script).
+
+    Translators should produce their output as a sequence of strings and let :py:func:`ModelTranslator._join` put them
+    together, rather than concatenating strings as they go.  (Repeated concatenation copies the output over and over,
+    which gets expensive for large models.)
+    """
+    chunk_size: int = 5000  #: the number of strings handed to a sink at a time
+
+    @abstractmethod
+    def translate(self, model_info: ModelInfo, **kwargs) -> str or None:
+        """
+        Translate a model into a format that your database can understand natively.
+
+        :param model_info: the model
+        :type model_info:  :py:class:`mothergeo.schemas.modeling.ModelInfo`
+        :return: the translated model
+        :rtype:  ``str``
+        """
+        pass
+
+    def _join(self, parts: Iterable[str], sink: Callable[[str], object]=None) -> str or None:
+        """
+        Put the translated parts together.
+
+        :param parts: the translated parts, in order
+        :type parts:  ``iter(str)``
+        :param sink: a function that receives the output a chunk at a time (or ``None`` to get the whole thing back)
+        :type sink:  ``callable``
+        :return: the complete output, or ``None`` if it was handed to the sink
+        :rtype:  ``str`` or ``None``
+        :seealso: :py:attr:`ModelTranslator.chunk_size`
+        """
+        # If there's nobody to hand the output to along the way, we can just join everything at once.
+        if sink is None:
+            return ''.join(parts)
+        # Otherwise, hand over the output one chunk at a time so we never hold all of it.
+        it = iter(parts)
+        batch = list(islice(it, self.chunk_size))
+        while batch:
+            sink(''.join(batch))
+            batch = list(islice(it, self.chunk_size))
+        return None
@@ -8,23 +8,125 @@
 Tools for working with data models in PostGIS.
 """
 
-# from ...schemas.modeling import ModelInfo
-# from ..modeling import ModelTranslator
-#
-#
-# class PgsqlModelTranslator(ModelTranslator):
-#     """
-#     This class converts the information in :py:class:`mothergeo.schemas.modeling.ModelInfo` instances into
-#     `PL/pgSQL <https://www.postgresql.org/docs/9.6/static/plpgsql.html>`_ suitable for running against your PostgreSQL
-#     database (with the PostGIS extension installed).
-#     """
-#     def translate(self, model_info: ModelInfo, **kwargs) -> str:
-#         """
-#         Translate a model into a format that your database can understand natively.
-#
-#         :param model_info: the model
-#         :type model_info:  :py:class:`mothergeo.schemas.modeling.ModelInfo`
-#         :return: a PL/pgSQL text representation of the model
-#         :rtype:  ``str``
-#         """
-#         return None
+from ...geometry import GeometryType, UnsupportedGeometryException
+from ...schemas.modeling import DataType, FeatureTableInfo, ModelInfo
+from ..modeling import DataTypeDefaults, ModelTranslator
+from .geoalchemy import UnsupportedDataTypeError
+from typing import Iterator
+
+_PG_TYPES = {
+    # How big can a string be?  (It's up to the field's preferences.)
+    DataType.TEXT: lambda preferences: 'varchar({length})'.format(
+        length=int(preferences.get('length', DataTypeDefaults.text_length))),
+    DataType.UUID: lambda preferences: 'uuid',
+    DataType.INT: lambda preferences: 'integer',
+    DataType.FLOAT: lambda preferences: 'double precision',
+    DataType.DATETIME: lambda preferences: 'timestamp'
+}  #: functions that take a field's preferences and return the PostgreSQL column type, indexed by data type
+
+_PG_GEOMETRY_TYPES = {
+    GeometryType.POINT: 'POINT',
+    GeometryType.POLYLINE: 'LINESTRING',
+    GeometryType.POLYGON: 'POLYGON'
+}  #: the PostGIS names of the supported geometry types
+
+
+def _quote(identifier: str) -> str:
+    """
+    Quote an identifier (like a table or column name) for PostgreSQL.
+
+    :param identifier: the identifier
+    :type identifier:  ``str``
+    :return: the quoted identifier
+    :rtype:  ``str``
+    """
+    return '"{identifier}"'.format(identifier=identifier.replace('"', '""'))
+
+
+class PgsqlModelTranslator(ModelTranslator):
+    """
+    This class converts the information in :py:class:`mothergeo.schemas.modeling.ModelInfo` instances into
+    `PL/pgSQL <https://www.postgresql.org/docs/9.6/static/plpgsql.html>`_ suitable for running against your PostgreSQL
+    database (with the PostGIS extension installed).
+    """
+    def __init__(self, geometry_column: str='geom', geometry_index_type: str='spgist'):
+        """
+
+        :param geometry_column: the name of the geometry column in each feature table
+        :type geometry_column:  ``str``
+        :param geometry_index_type: the type of index created on the geometry column (like ``'spgist'`` or ``'gist'``)
+        :type geometry_index_type:  ``str``
+        """
+        super().__init__()
+        self._geometry_column = geometry_column
+        self._geometry_index_type = geometry_index_type
+
+    def translate(self, model_info: ModelInfo, **kwargs) -> str or None:
+        """
+        Translate a model into a format that your database can understand natively.
+
+        :param model_info: the model
+        :type model_info:  :py:class:`mothergeo.schemas.modeling.ModelInfo`
+        :param schema: the PostgreSQL schema in which the tables are created (The default is ``'public'``.)
+        :type schema:  ``str``
+        :param sink: a function that receives the script a chunk at a time (or ``None`` to get the whole thing back)
+        :type sink:  ``callable``
+        :return: a PL/pgSQL text representation of the model (unless it was handed to a sink)
+        :rtype:  ``str`` or ``None``
+
+        .. note::
+
+            The whole script can be sent to the database in a single ``execute()`` (one round trip for every table).
+        """
+        schema = kwargs.get('schema', 'public')
+        return self._join(
+            (part
+             for feature_table in model_info.spatial_info.feature_tables
+             for part in self._create_table(feature_table=feature_table, schema=schema)),
+            sink=kwargs.get('sink'))
+
+    def _create_table(self, feature_table: FeatureTableInfo, schema: str) -> Iterator[str]:
+        """
+        Generate the statements that create a feature table.
+
+        :param feature_table: the feature table
+        :type feature_table:  :py:class:`FeatureTableInfo`
+        :param schema: the PostgreSQL schema
+        :type schema:  ``str``
+        :return: the parts of the statements, in order
+        :rtype:  ``iter(str)``
+        """
+        table = '{schema}.{name}'.format(schema=_quote(schema), name=_quote(feature_table.name)) \
+            if schema is not None else _quote(feature_table.name)
+        yield 'CREATE TABLE IF NOT EXISTS {table} (\n'.format(table=table)
+        identity_field = feature_table.get_identity_field()
+        for field in feature_table.fields:
+            # Look up the function that gives us the column type for the field's data type.
+            try:
+                column_type = _PG_TYPES[field.data_type]
+            except KeyError:
+                raise UnsupportedDataTypeError(
+                    message='The {dt} data type is unsupported.'.format(dt=field.data_type.name),
+                    data_type=field.data_type)
+            yield '    {name} {type}{pk}{unique},\n'.format(
+                name=_quote(field.name),
+                type=column_type(field.preferences or {}),
+                pk=' PRIMARY KEY' if field is identity_field else '',
+                unique=' UNIQUE' if field.unique and field is not identity_field else '')
+        # Now for the geometry column.
+        try:
+            geometry_type = _PG_GEOMETRY_TYPES[feature_table.geometry_type]
+        except KeyError:
+            raise UnsupportedGeometryException(
+                message='The {gt} geometry type is unsupported.'.format(gt=feature_table.geometry_type),
+                geometry_type=feature_table.geometry_type)
+        geometry_column = _quote(self._geometry_column)
+        yield '    {name} geometry({type}, {srid})\n);\n'.format(
+            name=geometry_column, type=geometry_type, srid=int(feature_table.srid))
+        # Finally, let's index the geometry column.
+        yield 'CREATE INDEX IF NOT EXISTS {index} ON {table} USING {using} ({column});\n'.format(
+            index=_quote('{name}_{column}_{using}_idx'.format(
+                name=feature_table.name, column=self._geometry_column, using=self._geometry_index_type)),
+            table=table,
+            using=self._geometry_index_type,
+            column=geometry_column)
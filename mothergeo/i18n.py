@@ -8,13 +8,13 @@
 Think locally, act globally.  These are tools to help with internationalization.
 """
 
-from collections import UserDict
 from typing import Dict
 
 current_locale = None  #: The current locale (``None`` indicates the default locale.)
+_MISSING = object()  #: a sentinel that stands in for a translation that isn't there
 
 
-class I18nPack(UserDict):
+class I18nPack(dict):
     """
     This is a dictionary of translatable strings.
     
@@ -30,6 +30,10 @@ class I18nPack(UserDict):
     
     .. seealso:: :py:func:`I18nPack.add_translation`
     """
+    # The pack is itself the dictionary of default translations (so lookups don't have to go through another
+    # dictionary), and the only other thing it needs is a place to keep the translations for other locales.
+    __slots__ = ('__translations',)
+
     def __init__(self, initialdata: dict=None):
         """
 
@@ -88,17 +92,19 @@ class I18nPack(UserDict):
             self.__translations[locale] = I18nPack(translations)
 
     def __getattr__(self, name):
-        # Let's figure out which pack we're supposed to be looking in.
-        pack = self.__translations[current_locale] \
-            if current_locale is not None and current_locale in self.__translations \
-            else self
-        # If the name is defined in the pack...
-        if name in pack:
-            return pack[name]  # ...great!
-        elif pack is not self and name in self:  # If it's not defined in the pack, but may be in the defaults...
-            return self[name] # ...return the default.
-        else:  # We just couldn't find it.  C'est la vie.
-            return None
+        # Special names (like __setstate__, which copy and pickle look for) are never translations.
+        if name[:2] == '__':
+            raise AttributeError(name)
+        # Let's figure out which pack we're supposed to be looking in.  (We only read the current locale once.)
+        locale = current_locale
+        pack = self.__translations.get(locale) if locale is not None else None
+        # If there's a pack for the current locale, and the name is defined in it...
+        if pack is not None:
+            value = pack.get(name, _MISSING)
+            if value is not _MISSING:
+                return value  # ...great!
+        # Otherwise, we'll return the default (or None if we just can't find it.  C'est la vie.)
+        return self.get(name)
 
 
 def localize(s: str) -> str:
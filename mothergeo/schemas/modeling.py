@@ -8,13 +8,14 @@
 The shape data takes.
 """
 
-from ..codetools import Enums
+from ..codetools import CaseInsensitiveDict, Enums
 from ..i18n import I18nPack
 from mothergeo.geometry import DEFAULT_SRID, GeometryType
-from insensitive_dict import CaseInsensitiveDict
-from typing import List, Iterator
+from typing import List, Iterator, NamedTuple
 
 import numbers
+from operator import attrgetter
+import sys
 from enum import Enum
 
 
@@ -44,6 +45,7 @@ class Source(object):
     """
     Source objects provide information about our expectations regarding the source from which data comes.
     """
+    __slots__ = ('_requirement', '_analogs')
 
     def __init__(self, requirement, analogs=None):
         """
@@ -82,6 +84,8 @@ class Target(object):
     """
     Source objects describe the contract presented to the consumer of the target data.
     """
+    __slots__ = ('_calculated', '_guaranteed')
+
     def __init__(self, calculated: bool=False, guaranteed: bool=False):
         """
         
@@ -118,6 +122,8 @@ class Usage(object):
     """
     Usage objects provide information about how data should be used.
     """
+    __slots__ = ('_search', '_display')
+
     def __init__(self, search: bool=False, display: bool=False):
         """ 
         :param search: is this data intended to be used in searches?
@@ -153,6 +159,8 @@ class NenaSpec(object):
     """
     NENA information objects describe how data relates to the `NENA standard <http://bit.ly/2qEGGgt>`_.
     """
+    __slots__ = ('_analog', '_required')
+
     def __init__(self, analog: str=None, required: bool=None):
         """
         :param analog: This is the name of the NENA analog for this data.
@@ -186,6 +194,9 @@ class FieldInfo(object):
     """
     This class describes a field in a relation (like a table, or a feature class).
     """
+    __slots__ = ('_name', '_unique', '_data_type', '_source', '_target', '_i18n', '_preferences', '_usage', '_nena',
+                 '_domain')
+
     def __init__(self,
                  name: str,
                  data_type: DataType or str,
@@ -336,6 +347,8 @@ class Revision(object):
     """
     A "revision" contains version information about when a model was defined.
     """
+    __slots__ = ('_title', '_sequence', '_author_name', '_author_email')
+
     def __init__(self, title: str, sequence: int or float, author_name: str, author_email: str):
         """
         
@@ -354,15 +367,22 @@ class Revision(object):
         if sequence is None:
             # ...let's just start at zero.
             self._sequence = 0
-        elif isinstance(sequence, numbers.Number):  # If they gave us an actual number...
+        elif isinstance(sequence, (int, float)):  # If they gave us an actual number (which they usually do)...
             # ...great!
             self._sequence = sequence
         elif isinstance(sequence, str):  # But maybe they gave us a string, in which case...
-            # ...we need to try to convert it to a number.
+            # ...we need to try to convert it to a number.  (Most sequences are whole numbers, so we try that first.)
             try:
-                self._sequence = float(sequence) if '.' in sequence else int(sequence)
-            except TypeError as te:
-                raise TypeError('sequence must be a number or a convertible string.') from te
+                self._sequence = int(sequence)
+            except ValueError:
+                try:
+                    self._sequence = float(sequence)
+                except ValueError as ve:
+                    raise ValueError('sequence must be a number or a convertible string.') from ve
+        elif isinstance(sequence, numbers.Number):  # It might still be some less common kind of number.
+            self._sequence = sequence
+        else:  # Anything else (like a list) just isn't a sequence number.
+            raise ValueError('sequence must be a number or a convertible string.')
         # Now let's get the other, simpler, properties.
         self._author_name = author_name
         self._author_email = author_email
@@ -408,10 +428,21 @@ class Revision(object):
         return self._author_email
 
 
+class FieldArrays(NamedTuple):
+    """
+    This is a named tuple that describes a relation's fields in field order (so code that works through all the
+    fields doesn't have to look up the same attributes on each :py:class:`FieldInfo` again and again).
+    """
+    names: tuple              #: the field names
+    identity_index: int=None  #: the index of the identity field (or ``None`` if the relation has no identity field)
+
+
 class RelationInfo(object):
     """
     Relation information objects describe entity relations (like tables in a database).
     """
+    __slots__ = ('_name', '_identity', '_fields', '_nena', '_i18n', '_field_arrays')
+
     def __init__(self,
                  name: str,
                  identity: str=None,
@@ -444,6 +475,7 @@ class RelationInfo(object):
             raise ValueError('common_fields must be a list.')
         self._nena = nena
         self._i18n = i18n
+        self._field_arrays = None  # We'll create the field arrays the first time somebody asks for them.
 
     @property
     def name(self) -> str:
@@ -473,6 +505,24 @@ class RelationInfo(object):
         """
         return iter(self._fields.values())
 
+    @property
+    def field_arrays(self) -> FieldArrays:
+        """
+        Get this relation's field names (in field order) along with the position of its identity field.
+
+        :return: the field arrays
+        :rtype:  :py:class:`FieldArrays`
+        """
+        # If we haven't done so already, let's build the arrays now (and keep them for next time).
+        if self._field_arrays is None:
+            fields = tuple(self._fields.values())
+            identity_field = self.get_identity_field()
+            self._field_arrays = FieldArrays(
+                # (Field names turn up again and again across relations, so we intern them.)
+                names=tuple(sys.intern(str(field.name)) for field in fields),
+                identity_index=next((i for i, field in enumerate(fields) if field is identity_field), None))
+        return self._field_arrays
+
     @property
     def i18n(self) -> I18nPack:
         """
@@ -516,6 +566,8 @@ class FeatureTableInfo(RelationInfo):
     """
     Feature table info objects describe a feature table (*a.k.a* a "feature class").
     """
+    __slots__ = ('_geometry_type', '_srid')
+
     def __init__(self,
                  name: str,
                  identity: str,
@@ -565,38 +617,41 @@ class FeatureTableInfo(RelationInfo):
         return self._srid if self._srid is not None else DEFAULT_SRID
 
 
+_get_name = attrgetter('name')  #: gets the name of a field or relation
+
+
 class _RelationInfoCollection(object):
     """
     This is a base class for collections of information that define the relations (tables) in a 
     :py:class:`ModelInfo`.
     """
+    __slots__ = ('_common_fields', '_relations', '_default_identity')
+
     def __init__(self, common_fields: List[FieldInfo], relations: List[RelationInfo], default_identity: str):
         """
         
         :param common_fields: the common fields shared among relations in this collection
-        :type common_fields:  ``list`` of :py:class:`FieldInfo`
+        :type common_fields:  ``iter(`` :py:class:`FieldInfo` ``)``
         :param relations: the relations in this collection
-        :type relations:  :py:class:`RelationInfo`
+        :type relations:  ``iter(`` :py:class:`RelationInfo` ``)``
         :param default_identity: the name of the default identity field for all defined relations
         :type default_identity:  ``str``
         :seealso: :py:func:`_RelationInfoCollection.default_identity`
         """
-        # If we didn't get any common fields...
-        if common_fields is None:
-            self._common_fields = {}  # ...our internal index is empty.
-        elif isinstance(common_fields, list):  # If we got the type we expect...
-            # ...create an index for the fields that uses the field name as a key.
-            self._common_fields = CaseInsensitiveDict({field.name: field for field in common_fields})
-        else:
-            raise ValueError('common_fields must be a list.')
-        # If we didn't get any relations...
-        if relations is None:
-            self._relations = {}  # ...our internal index is empty.
-        elif isinstance(relations, list):  # If we got the type we expect...
-            # ...create an index for the fields that uses the table's name as a key.
-            self._relations = CaseInsensitiveDict({field.name: field for field in relations})
-        else:
-            raise ValueError('relations must be a list.')
+        # Create an index for the common fields that uses the (lower-case) field name as a key.  (Any iterable will
+        # do, and if we didn't get any common fields, the index is empty.)  The keys and values are zipped together
+        # so the whole index is built without a Python-level loop.
+        try:
+            common_fields = tuple(common_fields or ())
+            self._common_fields = dict(zip(map(str.lower, map(_get_name, common_fields)), common_fields))
+        except (AttributeError, TypeError) as e:  # If we didn't get the type we expect...
+            raise ValueError('common_fields must be an iterable of fields.') from e
+        # Now do the same for the relations, using the (lower-case) table name as the key.
+        try:
+            relations = tuple(relations or ())
+            self._relations = dict(zip(map(str.lower, map(_get_name, relations)), relations))
+        except (AttributeError, TypeError) as e:
+            raise ValueError('relations must be an iterable of relations.') from e
         self._default_identity = default_identity
 
     def __iter__(self):
@@ -619,7 +674,7 @@ class _RelationInfoCollection(object):
 
         :rtype: :py:class:`Iterator`
         """
-        return iter(self._common_fields)
+        return iter(self._common_fields.values())
 
     def get_common_field(self, name: str) -> FieldInfo:
         """
@@ -632,10 +687,11 @@ class _RelationInfoCollection(object):
         """
         if name is None:
             raise TypeError("name cannot be None.")
-        elif name not in self._common_fields:
-            raise KeyError("Common field '{name)' is not defined.".format(name=name))
-        else:
-            return self._common_fields[name]
+        # The index uses lower-case names, so that's how we look the field up.
+        field = self._common_fields.get(name.lower())
+        if field is None:
+            raise KeyError("Common field '{name}' is not defined.".format(name=name))
+        return field
 
     @property
     def relations(self) -> Iterator[RelationInfo]:
@@ -657,10 +713,11 @@ class _RelationInfoCollection(object):
         """
         if name is None:
             raise TypeError('name cannot be None.')
-        elif name not in self._relations:
-            raise KeyError("Relation '{name)' is not defined.".format(name=name))
-        else:
-            return self._relations[name]
+        # The index uses lower-case names, so that's how we look the relation up.
+        relation = self._relations.get(name.lower())
+        if relation is None:
+            raise KeyError("Relation '{name}' is not defined.".format(name=name))
+        return relation
 
     def add_relation(self, relation: RelationInfo):
         """
@@ -673,16 +730,18 @@ class _RelationInfoCollection(object):
         """
         if relation is None:
             raise TypeError('relation cannot be None.')
-        elif relation.name in self._relations:
+        key = str(relation.name).lower()
+        if key in self._relations:
             raise KeyError('The collection already contains a relation named {name}'.format(name=relation.name))
-        else:
-            self._relations[relation.name] = relation
+        self._relations[key] = relation
 
 
 class FeatureTableInfoCollection(_RelationInfoCollection):
     """
     This is a base class for collections of feature tables.
     """
+    __slots__ = ('_common_srid',)
+
     def __init__(self, common_fields, feature_tables, default_identity, common_srid=None):
         super().__init__(common_fields=common_fields, relations=feature_tables, default_identity=default_identity)
         self._common_srid = common_srid
@@ -731,6 +790,8 @@ class SpatialInfo(object):
 
     :seealso: :py:class:`ModelInfo`
     """
+    __slots__ = ('_common_srid', '_default_identity', '_common_fields', '_feature_tables')
+
     def __init__(self,
                  common_srid: int,
                  default_identity: str,
@@ -793,6 +854,8 @@ class ModelInfo(object):
     """
     Instances of this class describe a data model.
     """
+    __slots__ = ('_name', '_revision', '_spatial_info')
+
     def __init__(self, name: str, revision: Revision, spatial_info: SpatialInfo):
         """
         
@@ -10,17 +10,25 @@ Provide a brief description of the module.
 
 from .modeling import (FieldInfo, ModelInfo, NenaSpec, Revision, Source, SpatialInfo, Target, FeatureTableInfo,
                        FeatureTableInfoCollection, Usage)
-from ..codetools import Dicts, Enums
+from ..codetools import Enums
 from ..geometry import DEFAULT_SRID, GeometryType
 from ..i18n import I18nPack
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import List
-import json
+import re
+
+try:  # If orjson is installed, we'll use it (it's a lot faster than the standard library)...
+    from orjson import loads as _json_loads
+except ImportError:  # ...otherwise, the standard library will do just fine.
+    from json import loads as _json_loads
+
+_JSON_DOCUMENT = re.compile(r'\s*[{\[]')  #: matches strings that look like JSON documents (not file paths)
 
 
 def throws_parse_exception(f):
     """
     This is a decorator for parsing methods that standardizes exceptions as :py:class:`ParseException` instances.
+    (It's a convenience:  methods on hot paths may want to handle the exceptions themselves to avoid the extra call.)
 
     :param f: the decorated function
     :type f:  ``func``
@@ -35,6 +43,8 @@ def throws_parse_exception(f):
             raise ParseException('Key error.') from k
         except FileNotFoundError as fnf:
             raise ParseException('File not found.') from fnf
+        except ValueError as ve:  # (This includes JSON decoding errors.)
+            raise ParseException('Value error.') from ve
 
     return wrapped
 
@@ -63,6 +73,31 @@ class ParseException(Exception):
         super().__init__(message)
 
 
+_MODEL_KEYS = frozenset({'revision', 'spatial'})  #: the properties a model's JSON object must have
+#: the properties the model's 'spatial' object must have
+_SPATIAL_KEYS = frozenset({'commonSrid', 'commonFields', 'defaultIdentity', 'featureTables'})
+
+
+def _require_keys(jsobj, keys: frozenset, what: str):
+    """
+    Make sure an object parsed from JSON is a JSON object with (at least) the properties we need.
+
+    :param jsobj: an object parsed from the original JSON string
+    :param keys: the names of the required properties
+    :type keys:  ``frozenset``
+    :param what: what the object represents (for the exception message)
+    :type what:  ``str``
+    :raises: :py:class:`ParseException` if the object doesn't have the required properties
+    """
+    # Comparing the key view to the required keys is a single check when everything is there (which it usually is).
+    if isinstance(jsobj, dict) and jsobj.keys() >= keys:
+        return
+    if not isinstance(jsobj, dict):
+        raise ParseException('The {what} must be a JSON object.'.format(what=what))
+    missing = ', '.join("'{key}'".format(key=key) for key in sorted(keys - jsobj.keys()))
+    raise ParseException('The {what} is missing required properties: {missing}'.format(what=what, missing=missing))
+
+
 class ModelInfoParser(object):
     """
     This is an abstract base class that can be extended to convert between strings and :py:class:`ModelInfo` 
@@ -101,29 +136,56 @@ class JsonModelInfoParser(ModelInfoParser):
     def __init__(self):
         super().__init__()
 
-    @throws_parse_exception
     def parse(self, s: str) -> ModelInfo:
         """
         Parse a JSON string into a :py:class:`Model` object.
 
-        :param s: the JSON string you want to parse, or the path to a file containing the JSON
-        :type s:  str
+        :param s: the JSON string (or the raw JSON bytes) you want to parse, or the path to a file containing the JSON
+        :type s:  ``str`` or ``bytes``
         :return: the :py:class:`ModelInfo`
         :rtype:  :py:class:`ModelInfo`
         :raises: :py:class:`ParseException` if we can't parse the input.
+
+        .. note::
+
+            Parsed models aren't cached.  Every call returns a new model that the caller is free to modify.
         """
-        parsed = None  # We're going to try a couple of ways to parse the JSON.
-        try:  # Let's see if we can just parse the input as JSON.
-            parsed = json.loads(s)
-        except ValueError:
-            pass  # Maybe the argument was a file path?
-        if parsed is None:  # If we didn't parse the input string successfully...
-            with open(s) as json_file:  # ...maybe the caller gave us a file path.
-                # So, let's try to parse the contents of the file.
-                parsed = json.load(json_file)
+        # (We handle exceptions here rather than using the throws_parse_exception decorator so that we don't pay
+        # for an extra function call every time we parse something.)
+        try:
+            # If the caller gave us raw bytes (say, straight off a socket), the parser can take them as they are.
+            if isinstance(s, (bytes, bytearray)):
+                return JsonModelInfoParser._json_2_model_info(_json_loads(s))
+            # If the input looks like a JSON document, let's parse it as one...
+            if _JSON_DOCUMENT.match(s):
+                return JsonModelInfoParser._json_2_model_info(_json_loads(s))
+            # ...otherwise, the caller must have given us a file path.
+            with open(s, 'rb') as json_file:
+                # Both parsers accept bytes, so we can skip decoding the file into a string first.
+                return JsonModelInfoParser._json_2_model_info(_json_loads(json_file.read()))
+        except KeyError as k:
+            raise ParseException('Key error.') from k
+        except FileNotFoundError as fnf:
+            raise ParseException('File not found.') from fnf
+        except ValueError as ve:  # (This includes JSON decoding errors.)
+            raise ParseException('Value error.') from ve
+
+    @staticmethod
+    def _json_2_model_info(parsed: dict) -> ModelInfo:
+        """
+        Construct a :py:class:`ModelInfo` from the object parsed out of a JSON string.
+
+        :param parsed: an object parsed from the original JSON string
+        :type parsed:  ``dict``
+        :return: the :py:class:`ModelInfo`
+        :rtype:  :py:class:`ModelInfo`
+        """
+        # Before we start, let's make sure the properties we need are all there.
+        _require_keys(parsed, _MODEL_KEYS, 'model')
+        _require_keys(parsed['spatial'], _SPATIAL_KEYS, "model's 'spatial' property")
         # Let's pull the stuff we want out of the JSON object, like...
-        name = Dicts.try_get(parsed, 'name', 'Nameless Model')  # ...the name of the model, and...
-        revision = JsonModelInfoParser._json_2_revision(parsed['revision'])  # ...the version (revision),
+        name = parsed.get('name', 'Nameless Model')  # ...the name of the model, and...
+        revision = JsonModelInfoParser._json_2_revision(parsed['revision'] or {})  # ...the version (revision),
         # ...and the feature tables (which come from the 'spatial' property).
         spatial_info = JsonModelInfoParser._json_2_spatial_info(parsed['spatial'])
         # We should now have enough information to create our model info object.
@@ -143,10 +205,7 @@ class JsonModelInfoParser(ModelInfoParser):
         :return: the :py:class:`Revision`
         :rtype:  :py:class:`Revision`
         """
-        return Revision(title=Dicts.try_get(jsobj, 'title').value,
-                        sequence=Dicts.try_get(jsobj, 'sequence').value,
-                        author_name=Dicts.try_get(jsobj, 'authorName').value,
-                        author_email=Dicts.try_get(jsobj, 'authorEmail').value)
+        return _revision(jsobj.get('title'), jsobj.get('sequence'), jsobj.get('authorName'), jsobj.get('authorEmail'))
 
     @staticmethod
     def _json_2_spatial_info(jsobj: dict) -> SpatialInfo:
@@ -168,7 +227,7 @@ class JsonModelInfoParser(ModelInfoParser):
         # Get the default identity.
         default_identity = jsobj['defaultIdentity']
         # Now the common spatial reference ID.
-        common_srid = Dicts.try_get(jsobj, 'commonSrid', DEFAULT_SRID).value
+        common_srid = jsobj.get('commonSrid', DEFAULT_SRID)
         # Create field information objects for the common fields.
         common_fields = [JsonModelInfoParser._json_2_field_info(fij) for fij in jsobj['commonFields']]
         # Now construct the feature tables.
@@ -194,7 +253,7 @@ class JsonModelInfoParser(ModelInfoParser):
             default_srid: int=None) -> FeatureTableInfo:
         name = jsobj['name']
         geometry_type = Enums.from_name(GeometryType, jsobj['geometryType'])
-        nena = JsonModelInfoParser._json_2_nena_spec(jsobj['nena'])
+        nena = JsonModelInfoParser._json_2_nena_spec(jsobj['nena'] or {})
         i18n = JsonModelInfoParser._json_2_i18n(jsobj['i18n'])
         # The full list of fields for the feature table includes all the fields specifically defined, plus the
         # common fields that have been defined.
@@ -213,14 +272,15 @@ class JsonModelInfoParser(ModelInfoParser):
     @throws_parse_exception
     def _json_2_field_info(jsobj: object) -> FieldInfo:
         name = jsobj['name']  # We absolutely require a name.
-        unique = Dicts.try_get(jsobj, 'unique', False).value
+        unique = jsobj.get('unique', False)
         data_type = jsobj['type']  # We absolutely require a data type.
-        domain = Dicts.try_get(jsobj, 'domain', None).value
-        preferences = Dicts.try_get(jsobj, 'preferences', None).value
-        source = JsonModelInfoParser._json_2_source(jsobj['source'])
-        target = JsonModelInfoParser._json_2_target(jsobj['target'])
-        usage = JsonModelInfoParser._json_2_usage(Dicts.try_get(jsobj, 'usage', {}).value)
-        nena = JsonModelInfoParser._json_2_nena_spec(Dicts.try_get(jsobj, 'nena', {}).value)
+        domain = jsobj.get('domain')
+        preferences = jsobj.get('preferences')
+        # (A null sub-object is treated like an empty one, so everything in it takes its default value.)
+        source = JsonModelInfoParser._json_2_source(jsobj['source'] or {})
+        target = JsonModelInfoParser._json_2_target(jsobj['target'] or {})
+        usage = JsonModelInfoParser._json_2_usage(jsobj.get('usage') or {})
+        nena = JsonModelInfoParser._json_2_nena_spec(jsobj.get('nena') or {})
         i18n = JsonModelInfoParser._json_2_i18n(jsobj['i18n'])  # We absolutely require I18n information.
         # Now that we have all our information, we can construct a FieldInfo object!
         return FieldInfo(
@@ -229,29 +289,29 @@ class JsonModelInfoParser(ModelInfoParser):
 
     @staticmethod
     def _json_2_source(jsobj: object) -> Source:
-        requirement = Dicts.try_get(jsobj, 'requirement', None).value
-        analogs = Dicts.try_get(jsobj, 'analogs', []).value
+        requirement = jsobj.get('requirement')
+        analogs = jsobj.get('analogs', [])
         source = Source(requirement=requirement, analogs=analogs)
         return source
 
     @staticmethod
     def _json_2_target(jsobj: object) -> Target:
-        calculated = Dicts.try_get(jsobj, 'calculated', False).value
-        guaranteed = Dicts.try_get(jsobj, 'guaranteed', False).value
+        calculated = jsobj.get('calculated', False)
+        guaranteed = jsobj.get('guaranteed', False)
         target = Target(calculated=calculated, guaranteed=guaranteed)
         return target
 
     @staticmethod
     def _json_2_usage(jsobj: object) -> Usage:
-        search = Dicts.try_get(jsobj, 'search', False).value
-        display = Dicts.try_get(jsobj, 'display', False).value
+        search = jsobj.get('search', False)
+        display = jsobj.get('display', False)
         usage = Usage(search=search, display=display)
         return usage
 
     @staticmethod
     def _json_2_nena_spec(jsobj: object) -> NenaSpec:
-        analog = Dicts.try_get(jsobj, 'analog', None).value
-        required = Dicts.try_get(jsobj, 'required', False).value
+        analog = jsobj.get('analog')
+        required = jsobj.get('required', False)
         nena_spec = NenaSpec(analog=analog, required=required)
         return nena_spec
 
@@ -267,3 +327,44 @@ class JsonModelInfoParser(ModelInfoParser):
         # That should be all.
         return pack
 
+
+def _revision(title: str, sequence: int or float, author_name: str, author_email: str) -> Revision:
+    """
+    Get a :py:class:`Revision`.  Revisions can't be modified, so models that share a revision can share the object.
+
+    :param title: the revision title
+    :type title:  ``str``
+    :param sequence: the revision sequence number
+    :type sequence:  ``int`` or ``float``
+    :param author_name: the name of the author
+    :type author_name:  ``str``
+    :param author_email: the author's email address
+    :type author_email:  ``str``
+    :return: the :py:class:`Revision`
+    :rtype:  :py:class:`Revision`
+    """
+    try:
+        return _cached_revision(title, sequence, author_name, author_email)
+    except TypeError:
+        # The JSON may contain values (like arrays or objects) that can't be cache keys, in which case we'll just
+        # create a revision that nobody else shares.
+        return Revision(title=title, sequence=sequence, author_name=author_name, author_email=author_email)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _cached_revision(title: str, sequence: int or float, author_name: str, author_email: str) -> Revision:
+    """
+    Get a shared :py:class:`Revision`.  (The results are cached, so all the arguments must be hashable.)
+
+    :param title: the revision title
+    :type title:  ``str``
+    :param sequence: the revision sequence number
+    :type sequence:  ``int`` or ``float``
+    :param author_name: the name of the author
+    :type author_name:  ``str``
+    :param author_email: the author's email address
+    :type author_email:  ``str``
+    :return: the :py:class:`Revision`
+    :rtype:  :py:class:`Revision`
+    """
+    return Revision(title=title, sequence=sequence, author_name=author_name, author_email=author_email)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from collections.abc import ValuesView
+from mothergeo.codetools import CaseInsensitiveDict
+
+
+class TestCaseInsensitiveDict(unittest.TestCase):
+
+    def test_getitem_ignores_case(self):
+        cid = CaseInsensitiveDict({'Alpha': 'apple'})
+        self.assertEqual('apple', cid['alpha'])
+        self.assertEqual('apple', cid['ALPHA'])
+        self.assertTrue('aLpHa' in cid)
+        self.assertFalse('beta' in cid)
+
+    def test_keys_keep_the_last_case_set(self):
+        cid = CaseInsensitiveDict({'Alpha': 'apple'})
+        cid['ALPHA'] = 'apricot'
+        self.assertEqual(['ALPHA'], list(cid))
+        self.assertEqual(['apricot'], list(cid.values()))
+        self.assertEqual(1, len(cid))
+
+    def test_get_and_delete(self):
+        cid = CaseInsensitiveDict(alpha='apple')
+        self.assertEqual('apple', cid.get('Alpha'))
+        self.assertIsNone(cid.get('beta'))
+        del cid['ALPHA']
+        self.assertEqual(0, len(cid))
+        with self.assertRaises(KeyError):
+            cid['alpha']
+
+    def test_non_string_keys(self):
+        cid = CaseInsensitiveDict({'Alpha': 'apple'})
+        with self.assertRaises(KeyError):
+            cid[1]
+        with self.assertRaises(KeyError):
+            cid[1] = 'one'
+        with self.assertRaises(KeyError):
+            del cid[None]
+        with self.assertRaises(KeyError):
+            cid.update({2: 'two'})
+        self.assertIsNone(cid.get(1))
+        self.assertEqual('default', cid.get(1, 'default'))
+        self.assertFalse(1 in cid)
+
+    def test_values_view(self):
+        cid = CaseInsensitiveDict({'Alpha': 'apple'})
+        values = cid.values()
+        self.assertIsInstance(values, ValuesView)
+        # The view reflects changes made after it was created.
+        cid['beta'] = 'banana'
+        self.assertEqual(['apple', 'banana'], list(values))
+        self.assertIn('banana', values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import configparser
+import os
+import tempfile
+import unittest
+from mothergeo.config import ConfigurationManager, _parse_simple_ini
+
+
+class TestConfigurationManager(unittest.TestCase):
+
+    def setUp(self):
+        # We'll keep track of the configuration files we write so we can clean them up afterward.
+        self._paths = []
+
+    def tearDown(self):
+        for path in self._paths:
+            os.remove(path)
+
+    def _write_config(self, text: str) -> str:
+        fd, path = tempfile.mkstemp(suffix='.ini')
+        with os.fdopen(fd, 'w') as config_file:
+            config_file.write(text)
+        self._paths.append(path)
+        return path
+
+    def test_load_simple(self):
+        path = self._write_config("""
+# A comment.
+[Database]
+Host = localhost
+port: 5432
+; Another comment.
+[Empty]
+""")
+        config = ConfigurationManager()
+        config.load(path)
+        self.assertEqual('localhost', config.get('Database', 'host'))
+        self.assertEqual('5432', config.get('Database', 'PORT'))
+        self.assertIsNone(config.get('Empty', 'anything'))
+        self.assertEqual('fallback', config.get('Empty', 'anything', fallback='fallback'))
+
+    def test_load_multiline_value(self):
+        path = self._write_config("""
+[Database]
+hosts = alpha
+  beta
+""")
+        config = ConfigurationManager()
+        config.load(path)
+        self.assertEqual('alpha\nbeta', config.get('Database', 'hosts'))
+
+    def test_load_changed_file(self):
+        path = self._write_config('[Database]\nhost = localhost\n')
+        config = ConfigurationManager()
+        config.load(path)
+        self.assertEqual('localhost', config.get('Database', 'host'))
+        # Loading the same (unchanged) file again should give us the same values.
+        config.load(path)
+        self.assertEqual('localhost', config.get('Database', 'host'))
+        # Now change the file (and its size) so the next load picks up the new value.
+        with open(path, 'w') as config_file:
+            config_file.write('[Database]\nhost = db.example.com\n')
+        config.load(path)
+        self.assertEqual('db.example.com', config.get('Database', 'host'))
+
+    def test_get_env_override(self):
+        path = self._write_config('[Database]\nhost = localhost\n')
+        config = ConfigurationManager()
+        config.load(path)
+        config.map_env_variable('Database', 'host', 'MOTHERGEO_TEST_DB_HOST')
+        # The environment variable isn't set, so we should get the configured value.
+        os.environ.pop('MOTHERGEO_TEST_DB_HOST', None)
+        self.assertEqual('localhost', config.get('Database', 'host'))
+        # Once it's set, the environment variable should win.
+        os.environ['MOTHERGEO_TEST_DB_HOST'] = 'db.example.com'
+        try:
+            self.assertEqual('db.example.com', config.get('Database', 'host'))
+            # When we unmap it, we're back to the configured value.
+            self.assertEqual('MOTHERGEO_TEST_DB_HOST', config.unmap_env_variable('Database', 'host'))
+            self.assertEqual('localhost', config.get('Database', 'host'))
+        finally:
+            del os.environ['MOTHERGEO_TEST_DB_HOST']
+
+    def test_load_duplicate_section(self):
+        path = self._write_config('[Database]\nhost = localhost\n[Database]\nport = 5432\n')
+        with self.assertRaises(configparser.DuplicateSectionError):
+            ConfigurationManager().load(path)
+
+    def test_load_duplicate_option(self):
+        path = self._write_config('[Database]\nhost = localhost\nHOST = db.example.com\n')
+        with self.assertRaises(configparser.DuplicateOptionError):
+            ConfigurationManager().load(path)
+
+    def test_load_malformed_line(self):
+        path = self._write_config('[Database]\nhost = localhost\n=x\n')
+        with self.assertRaises(configparser.ParsingError):
+            ConfigurationManager().load(path)
+
+    def test_load_percent(self):
+        path = self._write_config('[Database]\npassword = 50%%off\nbroken = 50%\n')
+        config = ConfigurationManager()
+        config.load(path)
+        self.assertEqual('50%off', config.get('Database', 'password'))
+        # A bare '%' fails when the value is interpolated, just like it does with ConfigParser itself.
+        with self.assertRaises(configparser.InterpolationSyntaxError):
+            config.get('Database', 'broken')
+
+    def test_load_malformed_headers(self):
+        for text in ('[db\nhost = x\n[other]\ny=1\n',
+                     '[a]\n[b]x=1\n',
+                     '[a]]\nx = 1\n',
+                     '[a]\n[b\nx = 1\n',
+                     'x = 1\n[a]\n',
+                     '[]\nx = 1\n',
+                     '[a]\n[ b ] ; comment\nx = 1\n',
+                     '[a]\n  [b]\nx = 1\n'):
+            with self.subTest(text=text):
+                # The fast parser shouldn't have an opinion about any of these...
+                self.assertIsNone(_parse_simple_ini(text))
+                # ...so loading them should do exactly what ConfigParser does.
+                expected = configparser.ConfigParser()
+                try:
+                    expected.read_string(text)
+                except configparser.Error as ce:
+                    with self.assertRaises(type(ce)):
+                        ConfigurationManager().load(self._write_config(text))
+                    continue
+                config = ConfigurationManager()
+                config.load(self._write_config(text))
+                for section in expected.sections():
+                    for option in expected.options(section):
+                        self.assertEqual(expected.get(section, option), config.get(section, option))
+                self.assertIsNone(config.get('a', '[b]x'))
+
+    def test_parse_simple_ini_matches_config_parser(self):
+        text = '# A comment.\n[Database]\nHost = localhost\nport:5432\nempty =\n\n[ Spaced Out ]\nk = v = w\n'
+        sections = _parse_simple_ini(text)
+        self.assertIsNotNone(sections)
+        expected = configparser.ConfigParser()
+        expected.read_string(text)
+        actual = configparser.ConfigParser()
+        actual.read_dict(sections)
+        self.assertEqual({section: dict(expected.items(section, raw=True)) for section in expected},
+                         {section: dict(actual.items(section, raw=True)) for section in actual})
+
+    def test_load_encoding(self):
+        fd, path = tempfile.mkstemp(suffix='.ini')
+        with os.fdopen(fd, 'w', encoding='utf-8') as config_file:
+            config_file.write('[Database]\nname = café\n')
+        self._paths.append(path)
+        config = ConfigurationManager()
+        config.load(path, encoding='utf-8')
+        self.assertEqual('café', config.get('Database', 'name'))
+
+    def test_load_missing_file(self):
+        config = ConfigurationManager()
+        config.load(os.path.join(tempfile.gettempdir(), 'this-file-does-not-exist.ini'))
+        self.assertIsNone(config.get('Database', 'host'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from mothergeo.db.modeling import ModelTranslator
+
+
+class _LineTranslator(ModelTranslator):
+    """
+    This is a simple translator that writes one line for each item in a list (in place of a model).
+    """
+    chunk_size = 2
+
+    def translate(self, model_info, **kwargs):
+        return self._join(('{item}\n'.format(item=item) for item in model_info), sink=kwargs.get('sink'))
+
+
+class TestModelTranslator(unittest.TestCase):
+
+    def test_join_without_sink(self):
+        translator = _LineTranslator()
+        self.assertEqual('a\nb\nc\n', translator.translate(['a', 'b', 'c']))
+
+    def test_join_with_sink(self):
+        translator = _LineTranslator()
+        chunks = []
+        self.assertIsNone(translator.translate(['a', 'b', 'c'], sink=chunks.append))
+        self.assertEqual(['a\nb\n', 'c\n'], chunks)
+
+    def test_join_with_sink_and_nothing_to_join(self):
+        translator = _LineTranslator()
+        chunks = []
+        translator.translate([], sink=chunks.append)
+        self.assertEqual([], chunks)
+
+
+if __name__ == '__main__':
+    unittest.main()
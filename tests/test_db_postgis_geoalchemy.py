@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import warnings
+from geoalchemy2.elements import WKBElement, WKTElement
+from mothergeo.db.postgis.geoalchemy import (GeoAlchemyDataStore, GeoAlchemyEntity, GeoAlchemyEntityClassFactory,
+                                             _copy_text)
+from mothergeo.schemas.modeling import FieldInfo, RelationInfo
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import InvalidRequestError, SAWarning
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import MagicMock
+
+
+def _field(name: str, data_type: str, **kwargs) -> FieldInfo:
+    return FieldInfo(name=name, data_type=data_type, source=None, target=None, i18n=None, **kwargs)
+
+
+def _relation(name: str, *extra_fields: FieldInfo) -> RelationInfo:
+    return RelationInfo(name=name, identity='id', fields=[
+        _field('id', 'INT'),
+        _field('label', 'TEXT', preferences={'length': 20}),
+        *extra_fields
+    ])
+
+
+def _attach_public_schema(dbapi_connection, connection_record):
+    # SQLite doesn't have schemas, but an attached database can play the part of PostgreSQL's 'public' schema.
+    dbapi_connection.execute("ATTACH ':memory:' AS public")
+
+
+class _GeoAlchemyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        event.listen(self.engine, 'connect', _attach_public_schema)
+        self.data_store = GeoAlchemyDataStore(engine=self.engine, session=sessionmaker(bind=self.engine)())
+        self.factory = GeoAlchemyEntityClassFactory(self.data_store)
+
+    def tearDown(self):
+        self.data_store.session.close()
+        self.engine.dispose()
+
+
+class TestGeoAlchemyEntityClassFactory(_GeoAlchemyTestCase):
+
+    def test_sqlalchemy_column_override(self):
+
+        class _CommentingFactory(GeoAlchemyEntityClassFactory):
+
+            @staticmethod
+            def _sqlalchemy_column(name, data_type, preferences, identity=False):
+                column = GeoAlchemyEntityClassFactory._sqlalchemy_column(name, data_type, preferences, identity)
+                column.comment = 'overridden'
+                return column
+
+        cls = _CommentingFactory(self.data_store).make(_relation('commented'))
+        self.assertEqual({'overridden'}, {column.comment for column in cls._geoalchemy_class.__table__.columns})
+
+    def test_make_same_relation_in_two_factories(self):
+        other_factory = GeoAlchemyEntityClassFactory(self.data_store)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            cls = self.factory.make(_relation('twins'))
+            other_cls = other_factory.make(_relation('twins'))
+        self.assertEqual([], [w for w in caught if issubclass(w.category, SAWarning)])
+        # Each factory has a class (and a table) of its own.
+        self.assertIsNot(cls, other_cls)
+        self.assertIsNot(cls._geoalchemy_class.__table__, other_cls._geoalchemy_class.__table__)
+        self.assertIsNot(cls._geoalchemy_class.registry, other_cls._geoalchemy_class.registry)
+
+    def test_make_cached(self):
+        cls = self.factory.make(_relation('cached'))
+        # An identical definition (even in a different RelationInfo) gives us the class we already made.
+        self.assertIs(cls, self.factory.make(_relation('cached')))
+        self.assertIs(cls, self.factory.get(_relation('cached')))
+
+    def test_make_redefined_table(self):
+        cls = self.factory.make(_relation('redefined'))
+        with self.assertRaises(InvalidRequestError):
+            self.factory.make(_relation('redefined', _field('extra', 'FLOAT')))
+        # The original definition still gives us the original class.
+        self.assertIs(cls, self.factory.make(_relation('redefined')))
+
+    def test_make_factories_isolated(self):
+        other_engine = create_engine('sqlite://')
+        event.listen(other_engine, 'connect', _attach_public_schema)
+        other_data_store = GeoAlchemyDataStore(engine=other_engine, session=sessionmaker(bind=other_engine)())
+        try:
+            cls = self.factory.make(_relation('isolated'))
+            # Another factory (working with another database) can define the same table differently.
+            other_cls = GeoAlchemyEntityClassFactory(other_data_store).make(
+                _relation('isolated', _field('extra', 'FLOAT')))
+            self.assertEqual(('id', 'label'), cls._column_names)
+            self.assertEqual(('id', 'label', 'extra'), other_cls._column_names)
+            self.assertEqual(['public.isolated'], list(self.factory.metadata.tables))
+        finally:
+            other_data_store.session.close()
+            other_engine.dispose()
+
+
+    def test_class_properties(self):
+        cls = self.factory.make(_relation('shared'))
+        entity = cls(id=1, label='one')
+        self.assertIs(self.data_store, entity._data_store)
+        # The class-level properties are shared by every instance, so they can't be set on just one of them...
+        for name in ('_data_store', '_geoalchemy_class', '_column_names'):
+            with self.subTest(name=name):
+                with self.assertRaises(AttributeError):
+                    setattr(entity, name, None)
+                self.assertIsNot(None, getattr(entity, name))
+                self.assertNotIn(name, vars(entity._geoalchemy_obj))
+        # ...but the encapsulated GeoAlchemy object belongs to the instance.
+        other = cls(id=2, label='two')
+        entity._geoalchemy_obj = other._geoalchemy_obj
+        self.assertEqual('two', entity.label)
+
+
+def _values(entity: GeoAlchemyEntity) -> tuple:
+    return tuple(getattr(entity, name) for name in type(entity)._column_names)
+
+
+class TestGeneratedMethods(_GeoAlchemyTestCase):
+
+    def _generic(self, cls: type, **kwargs) -> GeoAlchemyEntity:
+        # This is what the class' __init__ would do if the factory hadn't generated one.
+        entity = object.__new__(cls)
+        GeoAlchemyEntity.__init__(entity, **kwargs)
+        return entity
+
+    def test_init_matches_kwargs(self):
+        cls = self.factory.make(_relation('generated', _field('val', 'FLOAT')))
+        self.assertIsNot(GeoAlchemyEntity.__init__, cls.__init__)
+        for kwargs in ({'id': 1, 'label': 'one', 'val': 1.5}, {'label': 'two'}, {}):
+            with self.subTest(kwargs=kwargs):
+                entity = cls(**kwargs)
+                self.assertIs(cls, type(entity))
+                self.assertEqual(_values(self._generic(cls, **kwargs)), _values(entity))
+        # Neither version accepts a column the class doesn't have.
+        with self.assertRaises(TypeError):
+            cls(bogus=1)
+        with self.assertRaises(TypeError):
+            self._generic(cls, bogus=1)
+
+    def test_from_row_matches_init(self):
+        cls = self.factory.make(_relation('rows', _field('val', 'FLOAT')))
+        self.assertIsNot(GeoAlchemyEntity.from_row.__func__, cls.from_row)
+        entity = cls.from_row((1, 'one', 1.5))
+        self.assertIs(cls, type(entity))
+        self.assertEqual(_values(cls(id=1, label='one', val=1.5)), _values(entity))
+        # Entities made from rows can be saved like any others.
+        self.data_store.add(entity)
+        self.data_store.commit()
+        for row in ((1, 'one'), (1, 'one', 1.5, 'extra')):
+            with self.subTest(row=row):
+                with self.assertRaises(ValueError):
+                    cls.from_row(row)
+
+    def test_names_that_are_not_identifiers(self):
+        cls = self.factory.make(_relation('odd_names', _field('first name', 'TEXT'), _field('class', 'TEXT')))
+        # The generic methods have to handle these.
+        self.assertIs(GeoAlchemyEntity.__init__, cls.__init__)
+        self.assertIs(GeoAlchemyEntity.from_row.__func__, cls.from_row.__func__)
+        entity = cls(**{'id': 1, 'first name': 'Eric', 'class': 'A'})
+        self.assertEqual((1, None, 'Eric', 'A'), _values(entity))
+        self.assertEqual((2, 'two', 'Pat', 'B'), _values(cls.from_row((2, 'two', 'Pat', 'B'))))
+        with self.assertRaises(ValueError):
+            cls.from_row((3, 'three'))
+
+    def test_names_the_generated_code_uses(self):
+        cls = self.factory.make(_relation('reserved_names', _field('_new', 'INT')))
+        # The generated __init__ uses '_new' itself, so the generic one has to take its place...
+        self.assertIs(GeoAlchemyEntity.__init__, cls.__init__)
+        self.assertEqual((1, 'one', 2), _values(cls(id=1, label='one', _new=2)))
+        # ...but there's nothing wrong with setting an attribute called '_new' in a generated from_row().
+        self.assertIsNot(GeoAlchemyEntity.from_row.__func__, cls.from_row)
+        self.assertEqual((1, 'one', 2), _values(cls.from_row((1, 'one', 2))))
+
+    def test_base_type_with_init(self):
+
+        class _LabelledEntity(GeoAlchemyEntity):
+            __slots__ = ()
+
+            def __init__(self, **kwargs):
+                super().__init__(**{'label': 'unlabelled', **kwargs})
+
+        class _LabellingFactory(GeoAlchemyEntityClassFactory):
+
+            @property
+            def base_type(self):
+                return _LabelledEntity
+
+        cls = _LabellingFactory(self.data_store).make(_relation('labelled'))
+        # The factory mustn't generate methods that would skip the base type's __init__.
+        self.assertIs(_LabelledEntity.__init__, cls.__init__)
+        self.assertEqual((1, 'unlabelled'), _values(cls(id=1)))
+        self.assertEqual((2, 'two'), _values(cls(id=2, label='two')))
+        self.assertEqual((3, 'three'), _values(cls.from_row((3, 'three'))))
+        self.assertIsInstance(cls.from_row((3, 'three')), _LabelledEntity)
+
+
+
+class TestCopyText(unittest.TestCase):
+
+    _WKB = '0101000000000000000000f03f0000000000000040'  #: POINT(1 2)
+    _EWKB = '0101000020e6100000000000000000f03f0000000000000040'  #: SRID=4326;POINT(1 2)
+
+    def test_null(self):
+        self.assertEqual('\\N', _copy_text(None))
+
+    def test_escapes(self):
+        self.assertEqual('a\\tb\\nc\\rd\\\\e', _copy_text('a\tb\nc\rd\\e'))
+        # A string that just happens to look like the null marker mustn't turn into a null.
+        self.assertEqual('\\\\N', _copy_text('\\N'))
+        self.assertEqual('', _copy_text(''))
+
+    def test_numbers(self):
+        self.assertEqual('42', _copy_text(42))
+        self.assertEqual('1.5', _copy_text(1.5))
+
+    def test_geometries(self):
+        # Plain WKB (or WKT) with an SRID is written in the extended form, so the SRID isn't lost...
+        self.assertEqual(self._EWKB, _copy_text(WKBElement(self._WKB, srid=4326)))
+        self.assertEqual('SRID=3857;POINT(1 2)', _copy_text(WKTElement('POINT(1 2)', srid=3857)))
+        # ...while geometries that are already extended (or don't have an SRID) are written as they are.
+        self.assertEqual(self._EWKB, _copy_text(WKBElement(self._EWKB, extended=True)))
+        self.assertEqual(self._WKB, _copy_text(WKBElement(self._WKB)))
+        self.assertEqual('POINT(1 2)', _copy_text(WKTElement('POINT(1 2)')))
+
+
+class TestGeoAlchemyDataStore(_GeoAlchemyTestCase):
+
+    def _rows(self, cls: type) -> list:
+        return sorted(self.data_store.session.execute(select(cls._geoalchemy_class.__table__)).all())
+
+    def _copy_data_store(self, cursor) -> GeoAlchemyDataStore:
+        # The data store only needs the session to get to the DBAPI cursor.
+        session = MagicMock()
+        session.connection.return_value.connection.cursor.return_value = cursor
+        return GeoAlchemyDataStore(engine=self.engine, session=session)
+
+    def test_bulk_insert_different_keys(self):
+        cls = self.factory.make(_relation('inserted', _field('val', 'FLOAT')))
+        # Rows that supply different columns (or the same columns in a different order) can be mixed together, even in
+        # the same batch.
+        self.data_store.bulk_insert(cls, rows=iter([
+            {'id': 1, 'label': 'one', 'val': 1.5},
+            {'id': 2},
+            {'val': 3.5, 'id': 3},
+            {'id': 4, 'label': 'four', 'val': 4.5},
+            {'label': 'five', 'id': 5}
+        ]), batch_size=3)
+        self.data_store.commit()
+        self.assertEqual(
+            [(1, 'one', 1.5), (2, None, None), (3, None, 3.5), (4, 'four', 4.5), (5, 'five', None)], self._rows(cls))
+
+    def test_bulk_insert_entities(self):
+        cls = self.factory.make(_relation('inserted_entities'))
+        # Entities and dictionaries can be mixed, and only the columns that have been set on an entity are inserted.
+        self.data_store.bulk_insert(cls, rows=[cls(id=1, label='one'), {'id': 2, 'label': 'two'}, cls(id=3)])
+        self.data_store.commit()
+        self.assertEqual([(1, 'one'), (2, 'two'), (3, None)], self._rows(cls))
+        # The session doesn't know anything about the entities we inserted.
+        self.assertEqual(0, len(self.data_store.session.identity_map))
+
+    def test_copy_in_copy_expert(self):
+        cls = self.factory.make(_relation('copied', _field('val', 'FLOAT')))
+        copied = []
+        cursor = MagicMock(spec=['copy_expert', 'close'])
+        cursor.copy_expert.side_effect = lambda sql, f: copied.append((sql, f.read()))
+        self._copy_data_store(cursor).copy_in(
+            cls,
+            rows=[{'id': 1, 'label': 'a\tb', 'val': 1.5}, {'id': 2, 'val': None}, {'label': 'c', 'id': 3}],
+            columns=['label', 'id'],
+            batch_size=2)
+        # The rows are sent in batches, with the values in the order of the columns we asked for.
+        self.assertEqual(
+            [('COPY public.copied (label, id) FROM STDIN WITH (FORMAT text)', 'a\\tb\t1\n\\N\t2\n'),
+             ('COPY public.copied (label, id) FROM STDIN WITH (FORMAT text)', 'c\t3\n')],
+            copied)
+        cursor.close.assert_called_once_with()
+
+    def test_copy_in_copy(self):
+        cls = self.factory.make(_relation('copied3'))
+        cursor = MagicMock(spec=['copy', 'close'])
+        copy = cursor.copy.return_value.__enter__.return_value
+        self._copy_data_store(cursor).copy_in(cls, rows=[{'id': 1, 'label': 'one'}, {'id': 2}])
+        # Without any columns, we get all the table's columns (in the table's order).
+        cursor.copy.assert_called_once_with('COPY public.copied3 (id, label) FROM STDIN WITH (FORMAT text)')
+        copy.write.assert_called_once_with('1\tone\n2\t\\N\n')
+        cursor.close.assert_called_once_with()
+
+    def test_copy_in_without_copy(self):
+        cls = self.factory.make(_relation('not_copied'))
+        # SQLite's cursors can't COPY, so the rows are inserted instead.
+        self.data_store.copy_in(cls, rows=[{'id': 1, 'label': 'a\tb'}, {'id': 2, 'ignored': True}])
+        self.data_store.commit()
+        # (The values are inserted as they are, without any of COPY's escaping.)
+        self.assertEqual([(1, 'a\tb'), (2, None)], self._rows(cls))
+        # If we only ask for some of the columns, that's all we get.
+        self.data_store.copy_in(cls, rows=[{'id': 3, 'label': 'three'}], columns=['id'])
+        self.data_store.commit()
+        self.assertEqual((3, None), self._rows(cls)[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
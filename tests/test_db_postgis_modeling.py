@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from mothergeo.db.postgis.geoalchemy import UnsupportedDataTypeError
+from mothergeo.db.postgis.modeling import PgsqlModelTranslator
+from mothergeo.geometry import GeometryType
+from mothergeo.schemas.modeling import (FeatureTableInfo, FeatureTableInfoCollection, FieldInfo, ModelInfo, Revision,
+                                        SpatialInfo)
+
+
+def _model(*feature_tables: FeatureTableInfo) -> ModelInfo:
+    return ModelInfo(
+        name='Test Model',
+        revision=Revision(title=None, sequence=1, author_name=None, author_email=None),
+        spatial_info=SpatialInfo(
+            common_srid=3857,
+            default_identity='id',
+            common_fields=[],
+            feature_tables=FeatureTableInfoCollection(common_fields=[], feature_tables=list(feature_tables),
+                                                      default_identity='id')))
+
+
+class TestPgsqlModelTranslator(unittest.TestCase):
+
+    def setUp(self):
+        self.parcels = FeatureTableInfo(
+            name='Parcels',
+            identity='id',
+            geometry_type=GeometryType.POLYGON,
+            fields=[
+                FieldInfo(name='id', data_type='INT', source=None, target=None, i18n=None),
+                FieldInfo(name='apn', data_type='TEXT', source=None, target=None, i18n=None, unique=True,
+                          preferences={'length': 20}),
+                FieldInfo(name='area', data_type='FLOAT', source=None, target=None, i18n=None)
+            ],
+            srid=3857)
+
+    def test_translate(self):
+        script = PgsqlModelTranslator().translate(_model(self.parcels))
+        self.assertEqual(
+            'CREATE TABLE IF NOT EXISTS "public"."Parcels" (\n'
+            '    "id" integer PRIMARY KEY,\n'
+            '    "apn" varchar(20) UNIQUE,\n'
+            '    "area" double precision,\n'
+            '    "geom" geometry(POLYGON, 3857)\n'
+            ');\n'
+            'CREATE INDEX IF NOT EXISTS "Parcels_geom_spgist_idx" ON "public"."Parcels" USING spgist ("geom");\n',
+            script)
+
+    def test_translate_with_sink(self):
+        chunks = []
+        translator = PgsqlModelTranslator()
+        self.assertIsNone(translator.translate(_model(self.parcels), schema='gis', sink=chunks.append))
+        self.assertIn('"gis"."Parcels"', ''.join(chunks))
+
+    def test_translate_unsupported_data_type(self):
+        feature_table = FeatureTableInfo(
+            name='Things',
+            identity='id',
+            geometry_type=GeometryType.POINT,
+            fields=[FieldInfo(name='id', data_type='UNKNOWN', source=None, target=None, i18n=None)])
+        with self.assertRaises(UnsupportedDataTypeError):
+            PgsqlModelTranslator().translate(_model(feature_table))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
 import unittest
 import mothergeo.i18n
 from mothergeo.i18n import I18nPack
@@ -88,6 +90,19 @@ class TestI18nPack(unittest.TestCase):
         self.assertEqual(pack.beta, 'banana')
         self.assertEqual(pack.gamma, 'grapes')
 
+    def test_copy(self):
+        pack = I18nPack({'alpha': 'apple'})
+        pack.add_translation('alpha', '林檎', 'ja_jp')
+        for copied in (copy.copy(pack), pickle.loads(pickle.dumps(pack))):
+            self.assertIsInstance(copied, I18nPack)
+            self.assertEqual(copied.alpha, 'apple')
+            mothergeo.i18n.current_locale = 'ja_jp'
+            try:
+                self.assertEqual(copied.alpha, '林檎')
+            finally:
+                mothergeo.i18n.current_locale = None
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import unittest
-from mothergeo.schemas.modeling import Requirement, Revision, Source
+from mothergeo.schemas.modeling import FieldInfo, RelationInfo, Requirement, Revision, Source, \
+    FeatureTableInfoCollection
 
 
 class TestRevision(unittest.TestCase):
@@ -44,6 +45,13 @@ class TestRevision(unittest.TestCase):
                      author_name='Eric Blair',
                      author_email='eb1984@gmail.com')
 
+    def test_init_sequence_is_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            Revision(title='Test Title',
+                     sequence=[1],
+                     author_name='Eric Blair',
+                     author_email='eb1984@gmail.com')
+
 
 class TestSource(unittest.TestCase):
 
@@ -56,5 +64,68 @@ class TestSource(unittest.TestCase):
         self.assertEqual(Requirement.REQUESTED, source.requirement)
 
 
+class TestRelationInfo(unittest.TestCase):
+
+    def test_field_arrays(self):
+        fields = [
+            FieldInfo(name='label', data_type='TEXT', source=None, target=None, i18n=None, preferences={'length': 20}),
+            FieldInfo(name='id', data_type='INT', source=None, target=None, i18n=None)
+        ]
+        relation_info = RelationInfo(name='things', identity='ID', fields=fields)
+        field_arrays = relation_info.field_arrays
+        self.assertEqual(('label', 'id'), field_arrays.names)
+        self.assertEqual(1, field_arrays.identity_index)
+        # We should get the same arrays every time we ask.
+        self.assertIs(field_arrays, relation_info.field_arrays)
+
+    def test_field_arrays_no_fields(self):
+        field_arrays = RelationInfo(name='things').field_arrays
+        self.assertEqual((), field_arrays.names)
+        self.assertIsNone(field_arrays.identity_index)
+
+
+class TestFeatureTableInfoCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.common_field = FieldInfo(name='Id', data_type='INT', source=None, target=None, i18n=None)
+        self.relation_info = RelationInfo(name='Parcels')
+        self.collection = FeatureTableInfoCollection(common_fields=[self.common_field],
+                                                     feature_tables=[self.relation_info],
+                                                     default_identity='id')
+
+    def test_get_relation_ignores_case(self):
+        self.assertIs(self.relation_info, self.collection.get_relation('parcels'))
+        self.assertIs(self.relation_info, self.collection.get_feature_table('PARCELS'))
+
+    def test_get_relation_missing(self):
+        with self.assertRaises(KeyError):
+            self.collection.get_relation('roads')
+
+    def test_add_relation_duplicate(self):
+        with self.assertRaises(KeyError):
+            self.collection.add_relation(RelationInfo(name='PARCELS'))
+
+    def test_common_fields(self):
+        self.assertEqual([self.common_field], list(self.collection.common_fields))
+        self.assertIs(self.common_field, self.collection.get_common_field('ID'))
+        with self.assertRaises(KeyError):
+            self.collection.get_common_field('name')
+
+    def test_init_iterables(self):
+        collection = FeatureTableInfoCollection(common_fields=(self.common_field,),
+                                                feature_tables=(ft for ft in [self.relation_info]),
+                                                default_identity='id')
+        self.assertIs(self.relation_info, collection.get_relation('Parcels'))
+        self.assertIs(self.common_field, collection.get_common_field('id'))
+        empty = FeatureTableInfoCollection(common_fields=None, feature_tables=None, default_identity='id')
+        self.assertEqual([], list(empty.relations))
+
+    def test_init_invalid(self):
+        with self.assertRaises(ValueError):
+            FeatureTableInfoCollection(common_fields=42, feature_tables=None, default_identity='id')
+        with self.assertRaises(ValueError):
+            FeatureTableInfoCollection(common_fields=None, feature_tables='Parcels', default_identity='id')
+
+
 if __name__ == '__main__':
     unittest.main()
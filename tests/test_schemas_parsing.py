@@ -2,16 +2,112 @@
 # -*- coding: utf-8 -*-
 
 import json
+import os
+import tempfile
 import unittest
 import mothergeo.i18n
 from mothergeo.codetools import Iters
 from mothergeo.geometry import GeometryType
-from mothergeo.schemas.modeling import DataType, Requirement
-from mothergeo.schemas.parsing import JsonModelInfoParser
+from mothergeo.schemas.modeling import DataType, RelationInfo, Requirement
+from mothergeo.schemas.parsing import JsonModelInfoParser, ParseException
 
 
 class TestJsonModelInfoParser(unittest.TestCase):
 
+    _MINIMAL_MODEL_JSON = """
+    {
+        "name": "Minimal Model",
+        "revision": { "sequence": 3 },
+        "spatial": {
+            "commonSrid": 3857,
+            "commonFields": [],
+            "defaultIdentity": "id",
+            "featureTables": []
+        }
+    }
+    """
+
+    def test_parse_string(self):
+        model = JsonModelInfoParser().parse(self._MINIMAL_MODEL_JSON)
+        self.assertEqual('Minimal Model', model.name)
+        self.assertEqual(3, model.revision.sequence)
+
+    def test_parse_bytes(self):
+        model = JsonModelInfoParser().parse(self._MINIMAL_MODEL_JSON.encode('utf-8'))
+        self.assertEqual('Minimal Model', model.name)
+        model = JsonModelInfoParser().parse(bytearray(self._MINIMAL_MODEL_JSON, 'utf-8'))
+        self.assertEqual('Minimal Model', model.name)
+
+    def test_parse_string_independent(self):
+        parser = JsonModelInfoParser()
+        model = parser.parse(self._MINIMAL_MODEL_JSON)
+        model.spatial_info.feature_tables.add_relation(RelationInfo(name='Parcels'))
+        # Changing one model mustn't change the models we get from parsing the same JSON again.
+        other = parser.parse(self._MINIMAL_MODEL_JSON)
+        self.assertIsNot(model, other)
+        self.assertEqual([], list(other.spatial_info.feature_tables.feature_tables))
+
+    def test_parse_file(self):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as json_file:
+                json_file.write(self._MINIMAL_MODEL_JSON)
+            model = JsonModelInfoParser().parse(path)
+            self.assertEqual('Minimal Model', model.name)
+            self.assertEqual(3, model.revision.sequence)
+        finally:
+            os.remove(path)
+
+    def test_parse_file_independent(self):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as json_file:
+                json_file.write(self._MINIMAL_MODEL_JSON)
+            parser = JsonModelInfoParser()
+            model = parser.parse(path)
+            model.spatial_info.feature_tables.add_relation(RelationInfo(name='Parcels'))
+            # Changing one model mustn't change the models we get from parsing the same file again.
+            other = parser.parse(path)
+            self.assertIsNot(model, other)
+            self.assertEqual([], list(other.spatial_info.feature_tables.feature_tables))
+        finally:
+            os.remove(path)
+
+    def test_parse_missing_properties(self):
+        with self.assertRaisesRegex(ParseException, "'revision'"):
+            JsonModelInfoParser().parse('{ "name": "No Revision", "spatial": {} }')
+        with self.assertRaisesRegex(ParseException, "'commonSrid', 'featureTables'"):
+            JsonModelInfoParser().parse(
+                '{ "revision": null, "spatial": { "commonFields": [], "defaultIdentity": "id" } }')
+        with self.assertRaisesRegex(ParseException, 'JSON object'):
+            JsonModelInfoParser().parse('[]')
+
+    def test_json_2_revision_shared(self):
+        jsobj = {'title': 'The Title', 'sequence': 1, 'authorName': 'Pat Blair', 'authorEmail': 'pat@daburu.net'}
+        revision = JsonModelInfoParser._json_2_revision(jsobj)
+        self.assertIs(revision, JsonModelInfoParser._json_2_revision(dict(jsobj)))
+        # A float sequence isn't the same revision as an int sequence.
+        self.assertIsInstance(JsonModelInfoParser._json_2_revision(dict(jsobj, sequence=1.0)).sequence, float)
+
+    def test_parse_unhashable_revision_values(self):
+        model = JsonModelInfoParser().parse(
+            self._MINIMAL_MODEL_JSON.replace('{ "sequence": 3 }', '{ "title": ["A", "B"], "sequence": 3 }'))
+        self.assertEqual(['A', 'B'], model.revision.title)
+        self.assertEqual(3, model.revision.sequence)
+
+    def test_parse_unsupported_sequence(self):
+        for sequence in ('[1]', '{ "major": 1 }'):
+            with self.subTest(sequence=sequence):
+                with self.assertRaises(ParseException):
+                    JsonModelInfoParser().parse(self._MINIMAL_MODEL_JSON.replace(
+                        '{ "sequence": 3 }', '{{ "sequence": {sequence} }}'.format(sequence=sequence)))
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ParseException):
+            JsonModelInfoParser().parse('{ "name": ')
+        with self.assertRaises(ParseException):
+            JsonModelInfoParser().parse(os.path.join(tempfile.gettempdir(), 'this-file-does-not-exist.json'))
+
     def test_json_2_revision(self):
         jsons = """
         {